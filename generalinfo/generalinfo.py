@@ -4,6 +4,7 @@ import json
 import platform
 import sys
 import unicodedata
+from operator import attrgetter
 from pathlib import Path
 from typing import Union, TYPE_CHECKING
 
@@ -181,7 +182,7 @@ class GeneralInfo(commands.Cog, name=__plugin_name__):
 
         if isinstance(user, discord.Member):
             embed.add_field(name="Joined:", value=discord.utils.format_dt(user.joined_at, "F"))
-            join_position = sorted(user.guild.members, key=lambda m: m.joined_at).index(user) + 1
+            join_position = sorted(user.guild.members, key=attrgetter("joined_at")).index(user) + 1
             embed.add_field(name="Join Position:", value=f"{join_position}")
             embed.add_field(name="Nickname:", value=user.nick)
             if user.activity is not None:
@@ -291,7 +292,7 @@ class GeneralInfo(commands.Cog, name=__plugin_name__):
         entries = 0
         if roles_list:
             embed = embeds[0]
-            for role in reversed(sorted(roles_list, key=lambda role: role.position)):
+            for role in sorted(roles_list, key=attrgetter("position"), reverse=True):
                 line = f"{role.mention} : {plural(len(role.members)):member}\n"
                 if entries == 25:
                     embed = base_embed(True, line)
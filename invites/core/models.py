@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
 
@@ -17,6 +18,37 @@ if TYPE_CHECKING:
 logger = getLogger(__name__)
 
 
+class GuildConfig:
+    """
+    Runtime representation of the invites config of a guild.
+
+    The config cache still stores the raw dict, which is what gets saved into the database.
+    Use `Invites.update_guild_config` to make changes so both stay in sync.
+    """
+
+    __slots__ = ("channel", "webhook", "enable", "store_data")
+
+    def __init__(
+        self,
+        *,
+        channel: str = "0",
+        webhook: Optional[str] = None,
+        enable: bool = False,
+        store_data: bool = True,
+    ):
+        self.channel: str = channel
+        self.webhook: Optional[str] = webhook
+        self.enable: bool = enable
+        self.store_data: bool = store_data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> GuildConfig:
+        return cls(**{key: data[key] for key in cls.__slots__ if key in data})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
 class PartialInvite:
     """
     Partially constructed invite object.
@@ -102,19 +134,18 @@ class InviteTracker:
 
     async def populate_invites(self) -> None:
         await self.bot.wait_until_ready()
-
-        for guild in self.bot.guilds:
-            config = self.cog.guild_config(guild.id)
-            if not config["enable"]:
-                continue
-
-            logger.debug("Caching invites for guild (%s).", guild.name)
-            self.invite_cache[guild.id] = set(await guild.invites())
-
-            if "VANITY_URL" in guild.features:
-                vanity_inv = await guild.vanity_invite()
-                if vanity_inv is not None:
-                    self.vanity_invites[guild.id] = vanity_inv
+        guilds = [guild for guild in self.bot.guilds if self.cog.guild_config(guild.id).enable]
+        await asyncio.gather(*(self._populate_guild_invites(guild) for guild in guilds))
+
+    async def _populate_guild_invites(self, guild: discord.Guild) -> None:
+        logger.debug("Caching invites for guild (%s).", guild.name)
+        if "VANITY_URL" in guild.features:
+            invites, vanity_inv = await asyncio.gather(guild.invites(), guild.vanity_invite())
+            if vanity_inv is not None:
+                self.vanity_invites[guild.id] = vanity_inv
+        else:
+            invites = await guild.invites()
+        self.invite_cache[guild.id] = set(invites)
 
     async def get_used_invite(self, member: discord.Member) -> List[Optional[discord.Invite]]:
         """
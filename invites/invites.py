@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
-
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, TypedDict, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union, TYPE_CHECKING
 
 import discord
 from discord.ext import commands
@@ -14,14 +14,22 @@ from core import checks
 from core.models import getLogger, PermissionLevel
 from core.paginator import EmbedPaginatorSession
 
-from .core.models import InviteTracker, PartialInvite
+from .core.models import GuildConfig, InviteTracker, PartialInvite
 
 # temp for migration
 from .core.migration import db_migration
 
 info_json = Path(__file__).parent.resolve() / "info.json"
-with open(info_json, encoding="utf-8") as f:
-    __plugin_info__ = json.loads(f.read())
+try:
+    import orjson
+
+    with open(info_json, "rb") as f:
+        __plugin_info__ = orjson.loads(f.read())
+except ImportError:
+    import json
+
+    with open(info_json, encoding="utf-8") as f:
+        __plugin_info__ = json.loads(f.read())
 
 __plugin_name__ = __plugin_info__["name"]
 __version__ = __plugin_info__["version"]
@@ -49,10 +57,14 @@ if TYPE_CHECKING:
         channel: str
         webhook: Optional[str]
         enable: bool
+        store_data: bool
 
 
 logger = getLogger(__name__)
 
+_UTC = timezone.utc
+_ORD_SUFFIX = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
+
 
 class Invites(commands.Cog):
     __doc__ = __description__
@@ -75,40 +87,95 @@ class Invites(commands.Cog):
         self.db: AsyncIOMotorCollection = bot.api.get_plugin_partition(self)
         self.config: Config = Config(self, self.db)
         self.tracker: InviteTracker = InviteTracker(self)
+        self._guild_cfg_cache: Dict[int, GuildConfig] = {}
+        # (avatar key, image bytes), the key tells whether the bot's avatar has changed since
+        self._avatar_bytes: Optional[Tuple[str, bytes]] = None
+        self._webhook_cache: Dict[int, discord.Webhook] = {}
+        self._init_task: asyncio.Task = MISSING
+        self._migration_task: asyncio.Task = MISSING
 
     async def cog_load(self) -> None:
         """
         Initial tasks when loading the cog.
         """
-        self.bot.loop.create_task(self.initialize())
+        self._init_task = self.bot.loop.create_task(self.initialize())
+
+    async def cog_unload(self) -> None:
+        # the migration is left to finish, cancelling it after the old documents are deleted
+        # but before the new ones are inserted would lose all the user data
+        if self._init_task is not MISSING:
+            self._init_task.cancel()
 
     async def initialize(self) -> None:
         await self.bot.wait_for_connected()
         await self.populate_config()
+        # populating invites depends on the guild configs being fetched, so this cannot run
+        # concurrently with the step above. The guilds are fetched concurrently in there instead.
         await self.tracker.populate_invites()
 
         # temp for migration
         if not self.config.get("migrated", False):
-            await db_migration(self)
+            self._migration_task = self.bot.loop.create_task(db_migration(self))
 
     async def populate_config(self) -> None:
         """
         Populates the config cache with data from database.
         """
-        self.config.defaults = {
-            str(guild.id): self.config.deepcopy(self.default_config) for guild in self.bot.guilds
-        }
+        # no requests are made while building the defaults, only the fetch below awaits.
+        # a shallow copy is enough here since the default config only holds scalar values
+        self.config.defaults = {str(guild.id): dict(self.default_config) for guild in self.bot.guilds}
         await self.config.fetch()
+        self._guild_cfg_cache.clear()
 
-    def guild_config(self, guild_id: Union[int, str]) -> GuildConfigData:
-        guild_id = str(guild_id)
-        config = self.config.get(guild_id)
-        if config is None:
-            config = self.config.deepcopy(self.default_config)
-            self.config[guild_id] = config
+    def guild_config(self, guild_id: Union[int, str]) -> GuildConfig:
+        config = self._guild_cfg_cache.get(guild_id)
+        if config is not None:
+            return config
 
+        data = self.config.get(str(guild_id))
+        if data is None:
+            data = dict(self.default_config)
+            self.config[str(guild_id)] = data
+
+        config = GuildConfig.from_dict(data)
+        self._guild_cfg_cache[int(guild_id)] = config
         return config
 
+    async def update_guild_config(self, guild_id: Union[int, str], **kwargs: Any) -> GuildConfig:
+        """
+        Updates the config of the guild with the values provided and saves it into the database.
+
+        Parameters
+        ----------
+        guild_id : int or str
+            The ID of the guild.
+        **kwargs
+            The config keys and their new values.
+        """
+        config = self.guild_config(guild_id)
+        for key, value in kwargs.items():
+            setattr(config, key, value)
+        self.config[str(guild_id)] = config.to_dict()
+        await self.config.update()
+        return config
+
+    def _invalidate_guild_cache(self, guild_id: Union[int, str]) -> None:
+        """
+        Removes the cached config for the guild, so the next `.guild_config` call will
+        resolve it from the config cache.
+        """
+        self._guild_cfg_cache.pop(int(guild_id), None)
+
+    def _log_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
+        """
+        Returns the log channel of the guild, or `None` if the logging is disabled
+        or the channel could not be found.
+        """
+        config = self.guild_config(guild.id)
+        if not config.enable:
+            return None
+        return guild.get_channel(int(config.channel))
+
     async def _get_or_create_webhook(self, channel: discord.TextChannel) -> Optional[discord.Webhook]:
         """
         An internal method to retrieve an existing webhook from the channel if any, otherwise a new one
@@ -132,11 +199,13 @@ class Invites(commands.Cog):
 
         # webhook not found, we will just create a new one
         if not wh:
-            avatar = await self.bot.user.display_avatar.read()
+            avatar = self.bot.user.display_avatar
+            if self._avatar_bytes is None or self._avatar_bytes[0] != avatar.key:
+                self._avatar_bytes = (avatar.key, await avatar.read())
             try:
                 wh = await channel.create_webhook(
                     name=self.bot.user.name,
-                    avatar=avatar,
+                    avatar=self._avatar_bytes[1],
                     reason="Webhook for invite logs.",
                 )
             except Exception as e:
@@ -145,13 +214,21 @@ class Invites(commands.Cog):
 
         return wh
 
+    @staticmethod
+    def _fmt_inviter(inviter: Optional[discord.abc.User], inviter_id: Optional[int] = None) -> str:
+        if inviter:
+            return f"Name: {inviter.name}\nID: `{inviter.id}`"
+        if inviter_id:
+            return f"(`{inviter_id}`)"
+        return "`None`"
+
     @staticmethod
     def _string_fmt_dt(dt: Optional[Union[datetime, int, float]]) -> str:
         if dt is None:
-            return str(dt)
-        if isinstance(dt, (int, float)):
-            dt = datetime.fromtimestamp(dt)
-        return discord.utils.format_dt(dt, "F")
+            return "None"
+        if isinstance(dt, datetime):
+            return discord.utils.format_dt(dt, "F")
+        return discord.utils.format_dt(datetime.fromtimestamp(dt), "F")
 
     @commands.group(aliases=["invite"], invoke_without_command=True)
     @checks.has_permissions(PermissionLevel.MODERATOR)
@@ -175,7 +252,7 @@ class Invites(commands.Cog):
         """
         config = self.guild_config(ctx.guild.id)
 
-        channel = ctx.guild.get_channel(int(config["channel"]))
+        channel = ctx.guild.get_channel(int(config.channel))
         embed = discord.Embed(
             title="Invites Config",
             color=self.bot.main_color,
@@ -187,8 +264,8 @@ class Invites(commands.Cog):
             value=f'{getattr(channel, "mention", "`None`")}',
             inline=False,
         )
-        embed.add_field(name="Enabled:", value=f"`{config['enable']}`", inline=False)
-        embed.add_field(name="Webhook URL:", value=f'`{config["webhook"]}`', inline=False)
+        embed.add_field(name="Enabled:", value=f"`{config.enable}`", inline=False)
+        embed.add_field(name="Webhook URL:", value=f"`{config.webhook}`", inline=False)
         await ctx.send(embed=embed)
 
     @invites_config.command(name="channel")
@@ -205,15 +282,14 @@ class Invites(commands.Cog):
         """
         config = self.guild_config(ctx.guild.id)
         if channel is None:
-            channel = self.bot.get_channel(int(config.get("channel")))
+            channel = self.bot.get_channel(int(config.channel))
             if channel:
                 description = f"Invites logging channel is currently set to {channel.mention}."
             else:
                 description = "Invites logging channel is not set."
         else:
-            new_config = {"channel": str(channel.id), "webhook": None}
-            config.update(new_config)
-            await self.config.update()
+            self._webhook_cache.pop(ctx.guild.id, None)
+            await self.update_guild_config(ctx.guild.id, channel=str(channel.id), webhook=None)
             description = f"Log channel is now set to {channel.mention}."
 
         embed = discord.Embed(description=description, color=self.bot.main_color)
@@ -235,15 +311,13 @@ class Invites(commands.Cog):
         """
         config = self.guild_config(ctx.guild.id)
         if mode is None:
-            mode = config.get("enable")
+            mode = config.enable
             description = (
                 "Invites tracking logging is currently " + ("`enabled`" if mode else "`disabled`") + "."
             )
         else:
-            new_config = {"enable": mode}
-            config.update(new_config)
+            await self.update_guild_config(ctx.guild.id, enable=mode)
             description = ("Enabled " if mode else "Disabled ") + "the logging for invites tracking."
-            await self.config.update()
 
         embed = discord.Embed(description=description, color=self.bot.main_color)
         await ctx.send(embed=embed)
@@ -259,6 +333,8 @@ class Invites(commands.Cog):
         """
         guild_id = str(ctx.guild.id)
         self.config[guild_id] = self.config.copy(self.default_config)
+        self._invalidate_guild_cache(guild_id)
+        self._webhook_cache.pop(ctx.guild.id, None)
         await self.config.update()
 
         embed = discord.Embed(
@@ -303,15 +379,13 @@ class Invites(commands.Cog):
         """
         config = self.guild_config(ctx.guild.id)
         if mode is None:
-            mode = config.get("store_data")
+            mode = config.store_data
             description = (
                 "Invites tracking data store is currently " + ("`enabled`" if mode else "`disabled`") + "."
             )
         else:
-            new_config = {"enable": mode}
-            config.update(new_config)
+            await self.update_guild_config(ctx.guild.id, store_data=mode)
             description = ("Enabled " if mode else "Disabled ") + "data store for invites tracking."
-            await self.config.update()
 
         embed = discord.Embed(description=description, color=self.bot.main_color)
         await ctx.send(embed=embed)
@@ -346,12 +420,7 @@ class Invites(commands.Cog):
             inv_channel = f"<#{invite.channel_id}>" if channel_id else "`None`"
         embed.add_field(name="Invite channel:", value=inv_channel)
 
-        if invite.inviter:
-            inviter = f"Name: {invite.inviter.name}\nID: `{invite.inviter.id}`"
-        else:
-            inviter_id = invite.inviter_id
-            inviter = f"(`{inviter_id}`)" if inviter_id else "`None`"
-        embed.add_field(name="Invite created by:", value=inviter)
+        embed.add_field(name="Invite created by:", value=self._fmt_inviter(invite.inviter, invite.inviter_id))
         embed.add_field(name="Invite created at:", value=self._string_fmt_dt(invite.created_at))
         await ctx.send(embed=embed)
 
@@ -428,33 +497,31 @@ class Invites(commands.Cog):
         """
         invites_list = await ctx.guild.invites()
 
-        embeds = [
-            discord.Embed(
-                title="List of Invites",
-                color=discord.Color.dark_theme(),
-                description="",
-            )
-        ]
-        entries = 0
-
         if invites_list:
-            embed = embeds[0]
-
-            for invite in reversed(sorted(invites_list, key=lambda invite: invite.uses)):
-                line = f"{invite.uses} - {invite.inviter} (`{invite.inviter.id}`) - {invite.code}\n"
-                if entries == 25:
-                    embed = discord.Embed(
-                        title="List of Invites (Continued)",
-                        color=discord.Color.dark_theme(),
-                        description=line,
-                    )
-                    embeds.append(embed)
-                    entries = 1
-                else:
-                    embed.description += line
-                    entries += 1
+            pages: List[List[str]] = [[]]
+            for invite in sorted(invites_list, key=attrgetter("uses"), reverse=True):
+                if len(pages[-1]) == 25:
+                    pages.append([])
+                pages[-1].append(
+                    f"{invite.uses} - {invite.inviter} (`{invite.inviter.id}`) - {invite.code}\n"
+                )
+
+            embeds = [
+                discord.Embed(
+                    title="List of Invites" if i == 0 else "List of Invites (Continued)",
+                    color=discord.Color.dark_theme(),
+                    description="".join(page),
+                )
+                for i, page in enumerate(pages)
+            ]
         else:
-            embeds[0].description = "Currently there are no list of invites available."
+            embeds = [
+                discord.Embed(
+                    title="List of Invites",
+                    color=discord.Color.dark_theme(),
+                    description="Currently there are no list of invites available.",
+                )
+            ]
 
         session = EmbedPaginatorSession(ctx, *embeds)
         await session.run()
@@ -468,22 +535,16 @@ class Invites(commands.Cog):
         embed = discord.Embed(color=self.bot.main_color, title="__Invite Info__")
         embed.description = f"**Server:**\n{invite.guild}\n\n" f"**Invite link:**\n{invite.url}\n\n"
 
-        inviter = f"Name: {invite.inviter.name}\nID: `{invite.inviter.id}`" if invite.inviter else "`None`"
-        embed.add_field(name="Created by:", value=inviter)
+        embed.add_field(name="Created by:", value=self._fmt_inviter(invite.inviter))
         embed.add_field(name="Channel:", value=invite.channel.mention)
 
-        fetched_invites = await ctx.guild.invites()
-        if invite in fetched_invites:
-            local = False
-            for inv in fetched_invites:
-                if invite.id == inv.id:
-                    invite = inv
-                    local = True
-                    break
-            if local:
-                embed.add_field(name="Uses:", value=invite.uses)
-                embed.add_field(name="Created at:", value=self._string_fmt_dt(invite.created_at))
-                embed.add_field(name="Expires at:", value=self._string_fmt_dt(invite.expires_at))
+        fetched_invites = {inv.id: inv for inv in await ctx.guild.invites()}
+        local = fetched_invites.get(invite.id)
+        if local is not None:
+            invite = local
+            embed.add_field(name="Uses:", value=invite.uses)
+            embed.add_field(name="Created at:", value=self._string_fmt_dt(invite.created_at))
+            embed.add_field(name="Expires at:", value=self._string_fmt_dt(invite.expires_at))
         else:
             embed.description += f"**Member count:**\n{invite.approximate_member_count}\n\n"
 
@@ -509,8 +570,7 @@ class Invites(commands.Cog):
             color=discord.Color.blurple(),
             description=f"Deleted invite code: `{invite.code}`",
         )
-        inviter = f"Name: {invite.inviter.name}\nID: `{invite.inviter.id}`" if invite.inviter else "`None`"
-        embed.add_field(name="Created by:", value=inviter)
+        embed.add_field(name="Created by:", value=self._fmt_inviter(invite.inviter))
         embed.add_field(name="Channel:", value=invite.channel.mention)
         embed.add_field(name="Uses:", value=invite.uses)
         embed.add_field(name="Created at:", value=self._string_fmt_dt(invite.created_at))
@@ -525,18 +585,18 @@ class Invites(commands.Cog):
     @commands.Cog.listener()
     async def on_invite_create(self, invite: discord.Invite):
         config = self.guild_config(invite.guild.id)
-        if not config["enable"]:
+        if not config.enable:
             return
 
-        cached_invites = self.tracker.invite_cache.get(invite.guild.id)
+        invite_cache = self.tracker.invite_cache
+        cached_invites = invite_cache.get(invite.guild.id)
         if cached_invites is None:
-            cached_invites = set(await invite.guild.invites())
+            invite_cache[invite.guild.id] = set(await invite.guild.invites())
         else:
-            cached_invites.update({invite})
-        self.tracker.invite_cache[invite.guild.id] = cached_invites
+            cached_invites.add(invite)
         logger.debug("Invite created. Updating invite cache for guild (%s).", invite.guild)
 
-        channel = invite.guild.get_channel(int(config["channel"]))
+        channel = invite.guild.get_channel(int(config.channel))
         if channel is None:
             return
 
@@ -545,14 +605,14 @@ class Invites(commands.Cog):
             color=discord.Color.blue(),
             description=invite.url,
         )
-        embed.add_field(name="Created by:", value=f"Name: {invite.inviter.name}\nID: `{invite.inviter.id}`")
+        embed.add_field(name="Created by:", value=self._fmt_inviter(invite.inviter))
         embed.add_field(name="Channel:", value=str(getattr(invite.channel, "mention", None)))
         embed.add_field(name="Created at:", value=self._string_fmt_dt(invite.created_at))
         embed.add_field(name="Expires at:", value=self._string_fmt_dt(invite.expires_at))
 
         max_usage = str(invite.max_uses) if invite.max_uses else "Unlimited"
         embed.add_field(name="Max usage:", value=max_usage)
-        await self.send_log_embed(channel, embed)
+        self.bot.loop.create_task(self.send_log_embed(channel, embed))
 
     async def send_log_embed(self, channel: discord.TextChannel, embed: discord.Embed) -> None:
         """
@@ -566,15 +626,18 @@ class Invites(commands.Cog):
         embed : discord.Embed
             The embed object.
         """
-        config = self.guild_config(channel.guild.id)
-        wh_url = config.get("webhook")
-        if wh_url is None:
-            webhook = await self._get_or_create_webhook(channel)
+        guild_id = channel.guild.id
+        webhook = self._webhook_cache.get(guild_id)
+        if webhook is None:
+            wh_url = self.guild_config(guild_id).webhook
+            if wh_url is None:
+                webhook = await self._get_or_create_webhook(channel)
+                if webhook:
+                    await self.update_guild_config(guild_id, webhook=webhook.url)
+            else:
+                webhook = discord.Webhook.from_url(wh_url, session=self.bot.session)
             if webhook:
-                config["webhook"] = webhook.url
-                await self.config.update()
-        else:
-            webhook = discord.Webhook.from_url(wh_url, session=self.bot.session)
+                self._webhook_cache[guild_id] = webhook
 
         kwargs = {"embed": embed}
         if webhook:
@@ -590,25 +653,23 @@ class Invites(commands.Cog):
         if member.bot:
             return
 
-        config = self.guild_config(member.guild.id)
-        if not config["enable"]:
-            return
-        channel = member.guild.get_channel(int(config["channel"]))
+        channel = self._log_channel(member.guild)
         if channel is None:
             return
 
         embed = discord.Embed(
             title=f"{member.name} just joined.",
             color=discord.Color.green(),
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(_UTC),
         )
         embed.set_thumbnail(url=member.display_avatar.url)
         embed.set_footer(text=f"User ID: {member.id}")
 
-        join_position = sorted(member.guild.members, key=lambda m: m.joined_at).index(member) + 1
-        suffix = ["th", "st", "nd", "rd", "th"][min(join_position % 10, 4)]
-        if 11 <= (join_position % 100) <= 13:
-            suffix = "th"
+        joined_at = member.joined_at
+        join_position = sum(
+            1 for m in member.guild.members if m.joined_at is not None and m.joined_at <= joined_at
+        )
+        suffix = "th" if 11 <= (join_position % 100) <= 13 else _ORD_SUFFIX[join_position % 10]
 
         desc = f"{member.mention} is the {join_position}{suffix} to join."
         embed.description = desc + "\n"
@@ -631,12 +692,7 @@ class Invites(commands.Cog):
                 if invite == vanity_inv:
                     embed.add_field(name="Vanity:", value="True")
                 else:
-                    inviter = (
-                        f"Name: {invite.inviter.name}\nID: `{invite.inviter.id}`"
-                        if invite.inviter
-                        else "`None`"
-                    )
-                    embed.add_field(name="Invite created by:", value=inviter)
+                    embed.add_field(name="Invite created by:", value=self._fmt_inviter(invite.inviter))
                     embed.add_field(
                         name="Invite created at:",
                         value=self._string_fmt_dt(invite.created_at),
@@ -647,10 +703,10 @@ class Invites(commands.Cog):
                 embed.description += "\n⚠️ *More than 1 used invites are predicted.*\n"
         else:
             embed.description += "\n⚠️ *Something went wrong! Invite info could not be resolved.*\n"
-        await self.send_log_embed(channel, embed)
+        self.bot.loop.create_task(self.send_log_embed(channel, embed))
 
-        if len(pred_invs) == 1 and config.get("store_data"):
-            await self.tracker.save_user_data(member, pred_invs[0])
+        if len(pred_invs) == 1 and self.guild_config(member.guild.id).store_data:
+            self.bot.loop.create_task(self.tracker.save_user_data(member, pred_invs[0]))
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
@@ -658,24 +714,24 @@ class Invites(commands.Cog):
             return
 
         config = self.guild_config(member.guild.id)
-        if not config["enable"]:
+        if not config.enable:
             return
 
         user_data = await self.tracker.get_user_data(member)
         if user_data and str(member.guild.id) in user_data["guilds"]:
             invdata = user_data["guilds"].pop(str(member.guild.id)).get("invite")
-            if not user_data["guilds"] or not config.get("store_data"):
+            if not user_data["guilds"] or not config.store_data:
                 await self.tracker.remove_user_data(member.id)
             else:
                 await self.tracker.update_user_data(member, data=user_data)
         else:
             invdata = None
 
-        channel = member.guild.get_channel(int(config["channel"]))
+        channel = member.guild.get_channel(int(config.channel))
         if channel is None:
             return
 
-        embed = discord.Embed(color=discord.Color.red(), timestamp=datetime.utcnow())
+        embed = discord.Embed(color=discord.Color.red(), timestamp=datetime.now(_UTC))
         embed.set_thumbnail(url=member.display_avatar.url)
         embed.title = f"{member.name} left."
         embed.set_footer(text=f"User ID: {member.id}")
@@ -688,9 +744,10 @@ class Invites(commands.Cog):
         if member.nick:
             embed.description += "\n**Nickname:**\n" + member.nick + "\n"
 
-        role_list = [role.mention for role in reversed(member.roles) if role is not member.guild.default_role]
-        if role_list:
-            embed.description += "\n**Roles:**\n" + (" ".join(role_list)) + "\n"
+        default_role = member.guild.default_role
+        role_text = " ".join(role.mention for role in reversed(member.roles) if role is not default_role)
+        if role_text:
+            embed.description += "\n**Roles:**\n" + role_text + "\n"
 
         if invdata:
             invite = await PartialInvite.from_data(self.tracker, data=invdata)
@@ -703,14 +760,11 @@ class Invites(commands.Cog):
                 inv_channel = f"<#{invite.channel_id}>" if channel_id else "`None`"
             embed.add_field(name="Invite channel:", value=inv_channel)
 
-            if invite.inviter:
-                inviter = f"Name: {invite.inviter.name}\nID: `{invite.inviter.id}`"
-            else:
-                inviter_id = invite.inviter_id
-                inviter = f"(`{inviter_id}`)" if inviter_id else "`None`"
-            embed.add_field(name="Invite created by:", value=inviter)
+            embed.add_field(
+                name="Invite created by:", value=self._fmt_inviter(invite.inviter, invite.inviter_id)
+            )
 
-        await self.send_log_embed(channel, embed)
+        self.bot.loop.create_task(self.send_log_embed(channel, embed))
 
 
 async def setup(bot: ModmailBot) -> None:
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import zlib
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from discord.ext.modmail_utils import Config
 
@@ -72,9 +76,235 @@ _default_config: Dict[str, Any] = {
 }
 
 
+# changes whenever the default config above changes, so the default keys only have to be
+# resolved in the fetched data if the stored document was saved with different defaults.
+# the repr is hashed with crc32 since str hashes are randomized on every process.
+_SCHEMA_VERSION: int = zlib.crc32(repr(_default_config).encode("utf-8"))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns a read-only copy of a default config value, dictionaries are wrapped in
+    `MappingProxyType` and lists are converted to tuples.
+    """
+    t = type(value)
+    if t is dict:
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if t is list:
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _clone(value: Any) -> Any:
+    """
+    A cheaper alternative to `copy.deepcopy` for the default config values.
+
+    The defaults only consist of dictionaries, lists and immutable values, and no mutable
+    object is referenced twice, so only dictionaries and lists are copied. Values frozen
+    with `_freeze` are converted back to dictionaries and lists.
+    """
+    t = type(value)
+    if t is dict or t is MappingProxyType:
+        return {k: _clone(v) for k, v in value.items()}
+    if t is list or t is tuple:
+        return [_clone(v) for v in value]
+    return value
+
+
+def _dict_schema(base: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a tree of the keys in `base` that hold nested dictionaries, including the
+    frozen ones from `_freeze`.
+    """
+    return {
+        key: _dict_schema(value) for key, value in base.items() if isinstance(value, (dict, MappingProxyType))
+    }
+
+
+# Read-only snapshots of the config values that are read on interactions.
+# These are rebuilt by `SupportUtilityConfig` every time the config is fetched or updated.
+
+
+@dataclass(frozen=True)
+class EmbedConfig:
+    __slots__ = ("title", "description", "footer")
+
+    title: Optional[str]
+    description: Optional[str]
+    footer: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> EmbedConfig:
+        return cls(data.get("title"), data.get("description"), data.get("footer"))
+
+
+@dataclass(frozen=True)
+class SelectConfig:
+    __slots__ = ("options", "placeholder")
+
+    options: Tuple[Dict[str, Any], ...]
+    placeholder: Optional[str]
+
+
+@dataclass(frozen=True)
+class RatingConfig:
+    __slots__ = ("enable", "placeholder")
+
+    enable: bool
+    placeholder: Optional[str]
+
+
+@dataclass(frozen=True)
+class ContactConfig:
+    __slots__ = ("select", "override_dmdisabled", "confirmation_embed")
+
+    select: SelectConfig
+    override_dmdisabled: bool
+    confirmation_embed: EmbedConfig
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ContactConfig:
+        select = data["select"]
+        return cls(
+            select=SelectConfig(tuple(select["options"]), select.get("placeholder")),
+            override_dmdisabled=data.get("override_dmdisabled", False),
+            confirmation_embed=EmbedConfig.from_dict(data["confirmation"]["embed"]),
+        )
+
+
+@dataclass(frozen=True)
+class FeedbackConfig:
+    __slots__ = ("embed", "response", "rating")
+
+    embed: EmbedConfig
+    response: Optional[str]
+    rating: RatingConfig
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> FeedbackConfig:
+        rating = data.get("rating", {})
+        return cls(
+            embed=EmbedConfig.from_dict(data["embed"]),
+            response=data.get("response"),
+            rating=RatingConfig(rating.get("enable", False), rating.get("placeholder")),
+        )
+
+
+class ConfigBatch:
+    """
+    Collects config changes by their dotted path, e.g. `contact.message`.
+
+    The changes are saved into the database in a single update when the batch exits, and
+    only applied to the config cache after that succeeds. See `SupportUtilityConfig.batch`.
+    """
+
+    def __init__(self, config: SupportUtilityConfig):
+        self.config: SupportUtilityConfig = config
+        self.pending: Dict[str, Any] = {}
+
+    def __setitem__(self, path: str, value: Any) -> None:
+        self.pending[path] = value
+
+    def apply(self) -> None:
+        """
+        Applies the pending changes to the config cache.
+        """
+        cache = self.config.cache
+        for path, value in self.pending.items():
+            *parents, key = path.split(".")
+            data = cache
+            for parent in parents:
+                data = data[parent]
+            data[key] = value
+
+
+_frozen_defaults: Mapping[str, Any] = _freeze(_default_config)
+_default_dict_keys: Dict[str, Any] = _dict_schema(_default_config)
+
+
 class SupportUtilityConfig(Config):
     def __init__(self, cog: SupportUtility, db: AsyncIOMotorCollection):
-        super().__init__(cog, db, defaults=_default_config)
+        super().__init__(cog, db)
+        # read-only at every level, so the defaults are shared instead of deep copied on every
+        # load. use `.deepcopy` to get mutable values from them
+        self.defaults: Mapping[str, Any] = _frozen_defaults
+        self._dict_keys: Dict[str, Any] = _default_dict_keys
+        self.contact_proxy: ContactConfig = ContactConfig.from_dict(self.defaults["contact"])
+        self.feedback_proxy: FeedbackConfig = FeedbackConfig.from_dict(self.defaults["feedback"])
+
+    @staticmethod
+    def deepcopy(obj: Any) -> Any:
+        """
+        Same as the base implementation, but values from the read-only defaults are
+        converted back to dictionaries and lists, since those cannot be deep copied directly.
+        """
+        if isinstance(obj, (MappingProxyType, tuple)):
+            return _clone(obj)
+        return Config.deepcopy(obj)
+
+    def _build_proxies(self) -> None:
+        self.contact_proxy = ContactConfig.from_dict(self["contact"])
+        self.feedback_proxy = FeedbackConfig.from_dict(self["feedback"])
+
+    async def fetch(self, *, resolve_default_keys: bool = True) -> Dict[str, Any]:
+        """
+        Same as the base implementation, but resolving the default keys is skipped if the stored
+        data was already resolved against the current defaults.
+        """
+        data = await super().fetch(resolve_default_keys=False)
+        if not resolve_default_keys or data.get("_schema_version") == _SCHEMA_VERSION:
+            self._build_proxies()
+            return data
+
+        self._recursive_resolve_keys(self.defaults, data)
+        data["_schema_version"] = _SCHEMA_VERSION
+        self.refresh(data=data)
+        await self.update(data=data)
+        return data
+
+    async def update(self, **kwargs: Any) -> None:
+        """
+        Same as the base implementation. The read-only config snapshots are rebuilt
+        afterwards, since any changes are always followed by this method.
+        """
+        await super().update(**kwargs)
+        self._build_proxies()
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[ConfigBatch]:
+        """
+        Returns a context manager to make multiple config changes and save them with a single
+        `$set` of the changed paths, instead of writing the whole config document.
+
+        Usage:
+            async with config.batch() as batch:
+                batch["contact.message"] = None
+                batch["contact.channel"] = None
+        """
+        batch = ConfigBatch(self)
+        yield batch
+        # nothing is saved or cached if the block raised
+        if not batch.pending:
+            return
+        await super().update(data=batch.pending)
+        batch.apply()
+        self._build_proxies()
+
+    def _recursive_resolve_keys(self, base: Dict[str, Any], data: Dict[str, Any], **kwargs: Any) -> None:
+        """
+        Same as the base implementation, but walks the nested dictionaries with a stack
+        instead of recursion. Which keys hold nested dictionaries is resolved once on init,
+        so values do not need to be type checked on every fetch.
+        """
+        schema = self._dict_keys if base is self.defaults else _dict_schema(base)
+        stack = [(base, data, schema)]
+        while stack:
+            base, data, nested = stack.pop()
+            for key, value in base.items():
+                if key not in data:
+                    data[key] = _clone(value)
+                elif key in nested:
+                    stack.append((value, data[key], nested[key]))
 
     @property
     def contact(self) -> Dict[str, Any]:
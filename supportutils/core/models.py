@@ -10,18 +10,21 @@ from discord.utils import MISSING
 from core.models import getLogger
 from core.thread import Thread
 
-from .views import ContactView, FeedbackView
+from .views import ContactView, FeedbackView, resolve_button_payload
 
 
 if TYPE_CHECKING:
     from datetime import datetime
     from bot import ModmailBot
     from ..supportutils import SupportUtility
+    from .config import ContactConfig, FeedbackConfig
     from .views import Modal
 
 
 logger = getLogger(__name__)
 
+_CREATED_THREAD_TITLE = "Created Thread"
+
 
 class ContactManager:
     """
@@ -36,6 +39,8 @@ class ContactManager:
 
         # automatically assigned from ContactView class
         self.view: ContactView = MISSING
+        self._button_payload: Tuple[Optional[str], Optional[str], discord.ButtonStyle] = MISSING
+        self._created_embed_base: discord.Embed = MISSING
 
     async def initialize(self) -> None:
         """
@@ -68,6 +73,39 @@ class ContactManager:
         """
         return self.cog.config.contact
 
+    @property
+    def proxy(self) -> ContactConfig:
+        """
+        Read-only snapshot of the contact configurations.
+        """
+        return self.cog.config.contact_proxy
+
+    def build_button_payload(self) -> Tuple[Optional[str], Optional[str], discord.ButtonStyle]:
+        """
+        Returns the emoji, label and style for the contact button.
+        The result is cached until `.invalidate_button_payload` is called.
+        """
+        if self._button_payload is MISSING:
+            self._button_payload = resolve_button_payload(self.config["button"], "Contact")
+        return self._button_payload
+
+    def invalidate_button_payload(self) -> None:
+        self._button_payload = MISSING
+
+    def _created_thread_embed(self, recipient: Union[discord.Member, discord.User]) -> discord.Embed:
+        """
+        Returns the embed sent to the newly created thread channel.
+        Only the description varies, so the embed is copied from a template that is
+        rebuilt if the bot's main color changes.
+        """
+        color = self.bot.main_color
+        base = self._created_embed_base
+        if base is MISSING or base.color.value != color:
+            base = self._created_embed_base = discord.Embed(title=_CREATED_THREAD_TITLE, color=color)
+        embed = base.copy()
+        embed.description = f"Thread started by {recipient.mention}."
+        return embed
+
     def clear(self) -> None:
         """
         Reset the attributes to MISSING.
@@ -127,11 +165,7 @@ class ContactManager:
         self.bot.loop.create_task(thread.setup(creator=recipient, category=category, initial_message=message))
         del embed
 
-        embed = discord.Embed(
-            title="Created Thread",
-            description=f"Thread started by {recipient.mention}.",
-            color=self.bot.main_color,
-        )
+        embed = self._created_thread_embed(recipient)
         await thread.wait_until_ready()
         await thread.channel.send(embed=embed)
 
@@ -350,7 +384,7 @@ class Feedback:
         await self.manager.channel.send(embed=embed)
 
         embed = discord.Embed(
-            description=self.manager.config.get("response", "Thanks for your time."),
+            description=self.manager.proxy.response or "Thanks for your time.",
             color=self.bot.main_color,
         )
         await interaction.response.send_message(embed=embed)
@@ -377,6 +411,7 @@ class FeedbackManager:
         self.cog: SupportUtility = cog
         self.bot: ModmailBot = cog.bot
         self.active: Set[Feedback] = set()
+        self._button_payload: Tuple[Optional[str], Optional[str], discord.ButtonStyle] = MISSING
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -385,9 +420,28 @@ class FeedbackManager:
         """
         return self.cog.config.feedback
 
+    @property
+    def proxy(self) -> FeedbackConfig:
+        """
+        Read-only snapshot of the feedback configurations.
+        """
+        return self.cog.config.feedback_proxy
+
     def is_enabled(self) -> bool:
         return self.config.get("enable")
 
+    def build_button_payload(self) -> Tuple[Optional[str], Optional[str], discord.ButtonStyle]:
+        """
+        Returns the emoji, label and style for the feedback button.
+        The result is cached until `.invalidate_button_payload` is called.
+        """
+        if self._button_payload is MISSING:
+            self._button_payload = resolve_button_payload(self.config["button"], "Feedback")
+        return self._button_payload
+
+    def invalidate_button_payload(self) -> None:
+        self._button_payload = MISSING
+
     async def populate(self) -> None:
         """
         Populate active feedback sessions from database.
@@ -507,13 +561,14 @@ class FeedbackManager:
         if self.is_active(user):
             raise RuntimeError(f"There is already active feedback session for {user}.")
 
+        embed_config = self.proxy.embed
         embed = discord.Embed(
-            title=self.config["embed"].get("title"),
+            title=embed_config.title,
             color=self.bot.main_color,
-            description=self.config["embed"]["description"],
+            description=embed_config.description,
         )
         embed.set_author(name=self.bot.user.name, icon_url=self.bot.user.display_avatar)
-        footer_text = self.config["embed"].get("footer")
+        footer_text = embed_config.footer
         if not footer_text:
             footer_text = "Your feedback will be submitted to our staff"
         embed.set_footer(text=footer_text, icon_url=self.bot.guild.icon)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from copy import copy
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import discord
 from discord import ButtonStyle, Interaction, ui
@@ -22,18 +23,34 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+_STYLE_MAP: Dict[str, ButtonStyle] = dict(ButtonStyle.__members__)
+_DM_DISABLED_SET = frozenset((DMDisabled.NEW_THREADS, DMDisabled.ALL_THREADS))
+_RATING_OPTIONS: Tuple[discord.SelectOption, ...] = tuple(
+    discord.SelectOption(label="\N{WHITE MEDIUM STAR}" * num, value=str(num)) for num in range(5, 0, -1)
+)
+
+
+def resolve_button_payload(
+    button_config: Dict[str, Any], default_label: str
+) -> Tuple[Optional[str], Optional[str], ButtonStyle]:
+    """
+    Resolves the emoji, label and style for a button from its config.
+    """
+    emoji = button_config.get("emoji")
+    label = button_config.get("label")
+    if emoji is None and label is None:
+        label = default_label
+    style = _STYLE_MAP.get(button_config.get("style"), ButtonStyle.grey)
+    return emoji, label, style
+
 
 class Modal(uiModal):
 
     children: List[TextInput]
 
     async def on_submit(self, interaction: Interaction) -> None:
-        for child in self.children:
-            value = child.value
-            if not value:
-                # resolve empty string value
-                value = None
-            self.view.inputs[child.name] = value
+        # empty string values are resolved to None
+        self.view.inputs.update({child.name: child.value or None for child in self.children})
 
         self.view.interaction = interaction
         await self.followup_callback(interaction, self)
@@ -50,20 +67,25 @@ class DropdownMenu(ui.Select):
             options=options,
             **kwargs,
         )
+        self._option_by_value: Dict[str, discord.SelectOption] = {option.value: option for option in options}
+        self._last_default: Optional[discord.SelectOption] = next((o for o in options if o.default), None)
 
     async def callback(self, interaction: Interaction) -> None:
         assert self.view is not None
         option = self.get_option(self.values[0])
-        for opt in self.options:
-            opt.default = opt.value in self.values
+        # max_values is 1, so only the previous and the new selected options need to be updated
+        if self._last_default is not None:
+            self._last_default.default = False
+        option.default = True
+        self._last_default = option
         self.view.interaction = interaction
         await self.followup_callback(interaction, self, option=option)
 
     def get_option(self, value: str) -> discord.SelectOption:
-        for option in self.options:
-            if value == option.value:
-                return option
-        raise ValueError(f"Cannot find select option with value of `{value}`.")
+        try:
+            return self._option_by_value[value]
+        except KeyError:
+            raise ValueError(f"Cannot find select option with value of `{value}`.") from None
 
 
 class BaseView(View):
@@ -103,11 +125,10 @@ class SupportUtilityView(BaseView):
             return False
         return True
 
-    async def _action_cancel(self, *args) -> None:
+    async def _action_cancel(self, interaction: Interaction, item: Button) -> None:
         """
         Consistent callback for Cancel button.
         """
-        interaction, _ = args
         self.value = None
         await interaction.response.defer()
         self.disable_and_stop()
@@ -138,18 +159,14 @@ class ContactView(BaseView):
         if self.manager.view is not MISSING:
             raise RuntimeError("Another view is already attached to ContactManager instance.")
         self.manager.view = self
-        self.select_options = self.manager.config["select"]["options"]
+        self.refresh_options()
         self._temp_cached_users: Dict[str, float] = {}
+        self._category_cache: Dict[str, discord.abc.GuildChannel] = {}
+        self._embed_blocked: discord.Embed = MISSING
+        self._embed_blocked_key: Tuple[int, str] = MISSING
+        self._view_removed: bool = False
 
-        button_config = self.manager.config["button"]
-        emoji = button_config.get("emoji")
-        label = button_config.get("label")
-        if emoji is None and label is None:
-            label = "Contact"
-        try:
-            style = ButtonStyle[button_config.get("style")]
-        except (KeyError, TypeError, ValueError):
-            style = ButtonStyle.grey
+        emoji, label, style = self.manager.build_button_payload()
         payload = {
             "emoji": emoji,
             "label": label,
@@ -174,31 +191,52 @@ class ContactView(BaseView):
                 return False
         if self.bot.guild.get_member(user.id) is None:
             return False
+        # checks are ordered from the cheapest, the blocked check is the only one that may
+        # need to make requests
+        dm_disabled = self.bot.config["dm_disabled"]
+        if dm_disabled in _DM_DISABLED_SET and (
+            dm_disabled == DMDisabled.ALL_THREADS or not self.manager.proxy.override_dmdisabled
+        ):
+            embed = discord.Embed(
+                color=self.bot.error_color,
+                description=self.bot.config["disabled_new_thread_response"],
+            )
+            logger.info(
+                "A new thread using contact menu was blocked from %s due to disabled Modmail.",
+                user,
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return False
+
         thread = self.manager.find_thread(user)
-        embed = discord.Embed(color=self.bot.error_color)
         if thread:
             content = "A thread for you already exists"
             if thread.channel:
                 content += f" in {thread.channel.mention}"
             content += "."
-            embed.description = content
+            embed = discord.Embed(color=self.bot.error_color, description=content)
         elif await self.bot.is_blocked(user):
-            embed.description = f"You are currently blocked from contacting {self.bot.user.name}."
-        elif (
-            self.bot.config["dm_disabled"] == DMDisabled.NEW_THREADS
-            and not self.manager.config.get("override_dmdisabled")
-        ) or self.bot.config["dm_disabled"] == DMDisabled.ALL_THREADS:
-            embed.description = self.bot.config["disabled_new_thread_response"]
-            logger.info(
-                "A new thread using contact menu was blocked from %s due to disabled Modmail.",
-                user,
-            )
+            embed = self._blocked_embed()
         else:
             return True
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
         return False
 
+    def _blocked_embed(self) -> discord.Embed:
+        """
+        Returns the embed sent to blocked users.
+        The embed is reused until the bot's error color or name changes.
+        """
+        key = (self.bot.error_color, self.bot.user.name)
+        if key != self._embed_blocked_key:
+            self._embed_blocked = discord.Embed(
+                color=key[0],
+                description=f"You are currently blocked from contacting {key[1]}.",
+            )
+            self._embed_blocked_key = key
+        return self._embed_blocked
+
     async def _category_select_callback(
         self,
         interaction: discord.Interaction,
@@ -218,30 +256,25 @@ class ContactView(BaseView):
         self._temp_cached_users[str(user.id)] = discord.utils.utcnow().timestamp()
         category = None
         view = ConfirmView(bot=self.bot, user=user, timeout=30.0)
-        if self.select_options:
+        if self._prebuilt_options:
             view.clear_items()
-            options = []
-            for data in self.select_options:
-                option = discord.SelectOption(
-                    emoji=data.get("emoji"), label=data["label"], description=data.get("description")
-                )
-                options.append(option)
+            # copied since the default flag is set on the options of each dropdown
             dropdown = DropdownMenu(
-                options=options,
-                placeholder=self.manager.config["select"].get("placeholder"),
+                options=[copy(option) for option in self._prebuilt_options],
+                placeholder=self.manager.proxy.select.placeholder,
                 callback=self._category_select_callback,
             )
             view.add_item(dropdown)
             view.add_item(view.accept_button)
             view.add_item(view.deny_button)
 
-        embed_config = self.manager.config["confirmation"]["embed"]
+        embed_config = self.manager.proxy.confirmation_embed
         embed = discord.Embed(
-            title=embed_config["title"],
-            description=embed_config["description"],
+            title=embed_config.title,
+            description=embed_config.description,
             color=self.bot.main_color,
         )
-        footer = embed_config["footer"]
+        footer = embed_config.footer
         if footer:
             embed.set_footer(text=footer)
         await interaction.response.send_message(
@@ -257,14 +290,10 @@ class ContactView(BaseView):
             return
         if view.inputs:
             option = view.inputs["contact_option"]
-            category_id = None
-            for data in self.select_options:
-                if data.get("label") == option.label:
-                    category_id = data.get("category")
-                    break
+            category_id = self._category_by_label.get(option.label)
             if category_id is None:
                 raise ValueError(f"Category ID for {option.label} was not set.")
-            category = self.bot.get_channel(int(category_id))
+            category = self.get_category(category_id)
             if category is None:
                 # just log, the thread will be created in main category
                 logger.error(f"Category with ID {category_id} not found.")
@@ -272,18 +301,66 @@ class ContactView(BaseView):
         await self.manager.create_thread(user, category=category, interaction=view.interaction)
         self._temp_cached_users.pop(str(user.id), None)
 
+    def refresh_options(self) -> None:
+        """
+        Rebuilds the dropdown options and the category lookup from config.
+        This must be called after the dropdown option changes are saved with `config.update`.
+        """
+        self.select_options = self.manager.proxy.select.options
+        self._category_by_label: Dict[str, Optional[str]] = {
+            data["label"]: data.get("category") for data in self.select_options
+        }
+        self._prebuilt_options: List[discord.SelectOption] = [
+            discord.SelectOption(
+                emoji=data.get("emoji"), label=data["label"], description=data.get("description")
+            )
+            for data in self.select_options
+        ]
+
+    def get_category(self, category_id: str) -> Optional[discord.abc.GuildChannel]:
+        """
+        Returns the category channel linked to a dropdown option.
+        Resolved channels are cached, missing ones are looked up again on the next call.
+        """
+        category = self._category_cache.get(category_id)
+        if category is None:
+            category = self.bot.get_channel(int(category_id))
+            if category is not None:
+                self._category_cache[category_id] = category
+        return category
+
+    def clear_category(self, category_id: Union[int, str]) -> None:
+        """
+        Removes the category from the cache, e.g. when the channel is deleted.
+        """
+        self._category_cache.pop(str(category_id), None)
+
+    def mark_removed(self) -> None:
+        """
+        Marks the view as already removed from the message, e.g. when the message is deleted,
+        so `force_stop` does not have to edit it.
+        """
+        self._view_removed = True
+
     async def force_stop(self) -> None:
         """
         Stops listening to interactions made on this view and removes the view from the message.
         """
         self.stop()
+        self._category_cache.clear()
 
-        if self.message:
-            try:
-                await self.message.edit(view=None)
-            except discord.HTTPException:
-                # just supress this
-                return
+        if not self.message or self._view_removed:
+            return
+        try:
+            await self.message.edit(view=None)
+        except discord.NotFound:
+            # the message was deleted, nothing to remove
+            pass
+        except discord.HTTPException as exc:
+            # not critical, the view has stopped listening anyway
+            logger.error(f"Unable to remove the contact menu components. {type(exc).__name__}: {str(exc)}")
+            return
+        self._view_removed = True
 
 
 class FeedbackView(BaseView):
@@ -317,37 +394,25 @@ class FeedbackView(BaseView):
         """
         Add rating dropdown if enabled. Otherwise, return silently.
         """
-        rating_config = self.manager.config.get("rating", {})
-        if not rating_config.get("enable", False):
+        rating_config = self.manager.proxy.rating
+        if not rating_config.enable:
             return
-        options = []
-        for i in reversed(range(5)):
-            num = i + 1  # index zero
-            options.append(discord.SelectOption(label="\N{WHITE MEDIUM STAR}" * num, value=str(num)))
-        if options:
-            self.add_item(
-                DropdownMenu(
-                    options=options,
-                    placeholder=rating_config.get("placeholder"),
-                    callback=self._rating_select_callback,
-                    custom_id=f"feedback_dropdown",
-                    row=0,
-                )
+        # copied since the default flag is set on the options of each dropdown
+        self.add_item(
+            DropdownMenu(
+                options=[copy(option) for option in _RATING_OPTIONS],
+                placeholder=rating_config.placeholder,
+                callback=self._rating_select_callback,
+                custom_id=f"feedback_dropdown",
+                row=0,
             )
+        )
 
     def add_button(self) -> None:
         """
         Add the feedback button to this view.
         """
-        button_config = self.manager.config["button"]
-        emoji = button_config.get("emoji")
-        label = button_config.get("label")
-        if emoji is None and label is None:
-            label = "Feedback"
-        try:
-            style = ButtonStyle[button_config.get("style")]
-        except (KeyError, TypeError, ValueError):
-            style = ButtonStyle.grey
+        emoji, label, style = self.manager.build_button_payload()
         payload = {
             "emoji": emoji,
             "label": label,
@@ -372,11 +437,10 @@ class FeedbackView(BaseView):
         self.rating = option
         await interaction.response.edit_message(view=select.view)
 
-    async def _button_callback(self, *args, **kwargs) -> None:
+    async def _button_callback(self, interaction: Interaction, item: Button) -> None:
         """
         A single callback called when user presses the feedback button attached to this view.
         """
-        interaction, _ = args
         text_input = {
             "label": "Content",
             "max_length": Limit.text_input_max,
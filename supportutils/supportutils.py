@@ -83,6 +83,14 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
         await self.feedback_manager.populate()
         await self.move_manager.initialize()
 
+    def _refresh_contact_options(self) -> None:
+        """
+        Applies the dropdown config changes to the active contact menu, if any.
+        """
+        view = self.contact_manager.view
+        if view is not MISSING:
+            view.refresh_options()
+
     def _resolve_modal_payload(self, item: Button) -> Dict[str, Any]:
         """
         Internal method to respectively resolve the required payload to initiate
@@ -283,10 +291,12 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
         defaults: Dict[str, Any],
         argument: Optional[str],
     ) -> None:
+        manager = getattr(self, f"{keys[0]}_manager")
         if argument and argument.lower() in ("clear", "reset"):
             button_config.clear()
             for key, value in defaults.items():
                 button_config[key] = value
+            manager.invalidate_button_payload()
             await self.config.update()
             embed = discord.Embed(
                 color=self.bot.main_color,
@@ -332,6 +342,7 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
                 for key in list(payload):
                     embed.add_field(name=key.title(), value=f"`{payload[key]}`")
                     button_config[key] = payload.pop(key)
+                manager.invalidate_button_payload()
                 await self.config.update()
                 await view.interaction.followup.send(embed=embed)
         else:
@@ -506,9 +517,9 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
 
         view = ContactView(self)
         manager.message = view.message = message = await channel.send(embed=embed, view=view)
-        self.config.contact["message"] = str(message.id)
-        self.config.contact["channel"] = str(message.channel.id)
-        await self.config.update()
+        async with self.config.batch() as batch:
+            batch["contact.message"] = str(message.id)
+            batch["contact.channel"] = str(message.channel.id)
 
         if channel != ctx.channel:
             await ctx.message.add_reaction("\u2705")
@@ -537,9 +548,9 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
 
         view = ContactView(self, message)
         await message.edit(view=view)
-        self.config.contact["message"] = str(message.id)
-        self.config.contact["channel"] = str(message.channel.id)
-        await self.config.update()
+        async with self.config.batch() as batch:
+            batch["contact.message"] = str(message.id)
+            batch["contact.channel"] = str(message.channel.id)
         await ctx.message.add_reaction("\u2705")
 
     @contactmenu.command(name="refresh")
@@ -577,9 +588,9 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
 
         await manager.view.force_stop()
         manager.clear()
-        self.config.contact["message"] = None
-        self.config.contact["channel"] = None
-        await self.config.update()
+        async with self.config.batch() as batch:
+            batch["contact.message"] = None
+            batch["contact.channel"] = None
         embed = discord.Embed(
             color=self.bot.main_color,
             description="Contact menu is now cleared.",
@@ -727,6 +738,7 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
             payload[key] = view.outputs.pop(key)
         self.config.contact["select"]["options"].append(payload)
         await self.config.update()
+        self._refresh_contact_options()
         await view.interaction.followup.send(embed=embed)
 
     @cm_config_dropdown.command(name="list")
@@ -781,6 +793,7 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
 
         options.clear()
         await self.config.update()
+        self._refresh_contact_options()
         embed = discord.Embed(
             color=self.bot.main_color, description="All dropdown configurations are now cleared."
         )
@@ -861,7 +874,9 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
         del embed
 
         self.config.remove("contact", restore_default=True)
+        self.contact_manager.invalidate_button_payload()
         await self.config.update()
+        self._refresh_contact_options()
         embed = discord.Embed(
             color=self.bot.main_color,
             description="All contact menu configurations have been reset to defaults.",
@@ -1190,6 +1205,7 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
         del embed
 
         self.config.remove("feedback", restore_default=True)
+        self.feedback_manager.invalidate_button_payload()
         await self.config.update()
         embed = discord.Embed(
             color=self.bot.main_color,
@@ -1391,6 +1407,18 @@ class SupportUtility(commands.Cog, name=__plugin_name__):
         )
         await ctx.send(embed=embed)
 
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        view = self.contact_manager.view
+        if view is not MISSING:
+            view.clear_category(channel.id)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        view = self.contact_manager.view
+        if view is not MISSING and view.message and view.message.id == payload.message_id:
+            view.mark_removed()
+
     @commands.Cog.listener()
     async def on_thread_ready(self, thread: Thread, *args: Any) -> None:
         """
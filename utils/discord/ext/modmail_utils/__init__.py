@@ -1,6 +1,6 @@
 __title__ = "modmail_utils"
 __author__ = "Jerrie-Aries"
-__version__ = "0.1.10"
+__version__ = "0.1.11"
 __license__ = "AGPL"
 
 from .chat_formatting import *
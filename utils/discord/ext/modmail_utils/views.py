@@ -154,12 +154,22 @@ class ConfirmView(View):
         """
         if self.message.flags.ephemeral or self._delete_when_complete:
             await interaction.response.defer()
-            await interaction.delete_original_response()
+            # nothing after this depends on the message being gone, so don't hold up
+            # whoever is waiting on this view
+            self.bot.loop.create_task(self._delete_original_response(interaction))
         else:
             self.refresh()
             await interaction.response.edit_message(view=self)
         self.stop()
 
+    @staticmethod
+    async def _delete_original_response(interaction: Interaction) -> None:
+        try:
+            await interaction.delete_original_response()
+        except discord.HTTPException:
+            # already deleted or the interaction token expired
+            pass
+
     def refresh(self) -> None:
         """
         Refresh the buttons on this view. If interaction has been made the buttons